@@ -163,6 +163,15 @@ class TestFileStorage_methods(unittest.TestCase):
         self.assertIn("Amenity." + am.id, objs)
         self.assertIn("Review." + rv.id, objs)
 
+    def test_reload_non_str_id(self):
+        bm = BaseModel()
+        bm.id = 5
+        models.storage.new(bm)
+        models.storage.save()
+        models.storage.reload()
+        objs = FileStorage._FileStorage__objects
+        self.assertIn("BaseModel.5", objs)
+
     def test_reload_no_file(self):
         self.assertRaises(FileNotFoundError, models.storage.reload())
 